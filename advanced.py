@@ -1,9 +1,14 @@
 import pygame
-import random
-from typing import List, Tuple
+from typing import FrozenSet, List, Optional, Tuple
+from snake import Snake
+from food import Food
+from level import Level, generate_walls
+from board import get_board
+from utils import spawn_position, wait_for_event
 
 class Obstacle:
-    def __init__(self, screen_width: int, screen_height: int, grid_size: int, number_of_obstacles: int = 5):
+    def __init__(self, screen_width: int, screen_height: int, grid_size: int, number_of_obstacles: int = 5,
+                 level: Optional[Level] = None):
         """
         Initializes the obstacle objects with random or predefined positions.
         
@@ -11,26 +16,42 @@ class Obstacle:
         :param screen_height: The height of the game screen.
         :param grid_size: The size of the grid (used to align the obstacle on the grid).
         :param number_of_obstacles: The number of obstacles to generate.
+        :param level: A pre-generated level whose walls are used instead of random obstacles.
         """
         self.grid_size = grid_size
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.color = (139, 69, 19)  # Brown color for obstacles
-        self.positions = self.generate_obstacles(number_of_obstacles)
+        if level is not None:
+            self.positions = level.positions(grid_size)
+        else:
+            self.positions = self.generate_obstacles(number_of_obstacles)
+
+    @property
+    def positions(self) -> List[Tuple[int, int]]:
+        """
+        The obstacle positions as a list, used for drawing.
+        """
+        return self._positions
+
+    @positions.setter
+    def positions(self, positions: List[Tuple[int, int]]):
+        self._positions = list(positions)
+        self.cells: FrozenSet[Tuple[int, int]] = frozenset(self._positions)  # For constant-time collision lookups
     
     def generate_obstacles(self, number_of_obstacles: int) -> List[Tuple[int, int]]:
         """
-        Generates a list of random positions for the obstacles on the grid.
+        Generates a list of distinct random positions for the obstacles on the grid. The snake's spawn corridor in the
+        middle of the screen is kept clear and every free cell stays reachable.
         
         :param number_of_obstacles: The number of obstacles to generate.
         :return: A list of tuples representing the (x, y) positions of the obstacles.
         """
-        positions = []
-        for _ in range(number_of_obstacles):
-            x = random.randint(0, (self.screen_width // self.grid_size) - 1) * self.grid_size
-            y = random.randint(0, (self.screen_height // self.grid_size) - 1) * self.grid_size
-            positions.append((x, y))
-        return positions
+        cols = self.screen_width // self.grid_size
+        rows = self.screen_height // self.grid_size
+        spawn_x, spawn_y = spawn_position(self.screen_width, self.screen_height, self.grid_size)
+        spawn = (spawn_x // self.grid_size, spawn_y // self.grid_size)
+        return generate_walls(cols, rows, number_of_obstacles, spawn).positions(self.grid_size)
     
     def draw(self, screen):
         """
@@ -43,32 +64,61 @@ class Obstacle:
 
 
 class AdvancedGame:
-    def __init__(self, screen_width=600, screen_height=400, grid_size=20):
+    def __init__(self, screen_width=600, screen_height=400, grid_size=20, level: Optional[Level] = None,
+                 wrap: bool = False):
         """
         Initializes the advanced game by creating the necessary game objects and setting up the environment.
         
         :param screen_width: Width of the game screen.
         :param screen_height: Height of the game screen.
         :param grid_size: Size of the grid units.
+        :param level: A pre-generated level to play on instead of random obstacles.
+        :param wrap: Whether the snake wraps around the screen edges instead of dying on them.
         """
         pygame.init()
         
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.grid_size = grid_size
+        self.level = level
+        self.board = get_board(screen_width // grid_size, screen_height // grid_size, grid_size, wrap)
         
         self.screen = pygame.display.set_mode((self.screen_width, self.screen_height))
         pygame.display.set_caption('Advanced Snake Game')
         
         self.clock = pygame.time.Clock()
-        self.snake = Snake(initial_position=(self.screen_width // 2, self.screen_height // 2), grid_size=self.grid_size)
+        self.font = pygame.font.Font(None, 36)
+        self.large_font = pygame.font.Font(None, 72)
+        self.high_score = self.load_high_score()
+        self.recorder = None  # Optional capture.FrameRecorder fed by render()
+        self.rewind_buffer = None  # Optional rewind.RewindBuffer recorded every tick, rewound with Backspace
+        self.telemetry = None  # Optional telemetry.Telemetry fed every tick and at the end of each game
+        self.reset()
+
+    def reset(self):
+        """
+        Resets the game state for a new round. The display surface, clock, fonts and cached high score are reused,
+        so restarting does not re-initialize Pygame or re-read the high score file. The round being replaced is
+        reported to telemetry first, and an attached rewind buffer starts a new history at the fresh round's first
+        tick so it can never replay the previous round.
+        """
+        self.report_session()
+        self.snake = Snake(initial_position=spawn_position(self.screen_width, self.screen_height, self.grid_size),
+                           grid_size=self.grid_size, board=self.board)
         self.food = Food(screen_width=self.screen_width, screen_height=self.screen_height, grid_size=self.grid_size)
-        self.obstacles = Obstacle(screen_width=self.screen_width, screen_height=self.screen_height, grid_size=self.grid_size)
+        self.obstacles = Obstacle(screen_width=self.screen_width, screen_height=self.screen_height, grid_size=self.grid_size,
+                                  level=self.level)
+        self.food.respawn(self.snake.body, self.obstacles.cells)  # Keep the first food off obstacles too
         
         self.score = 0
-        self.high_score = self.load_high_score()
         self.difficulty_level = 1
         self.game_over = False
+        self.paused = False
+        self.paused_by_focus = False
+        self.death_cause = None
+        if self.rewind_buffer is not None:
+            self.rewind_buffer.clear()
+            self.rewind_buffer.record(self)
 
     def load_high_score(self) -> int:
         """
@@ -96,8 +146,16 @@ class AdvancedGame:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.game_over = True
+            elif event.type == pygame.WINDOWFOCUSLOST and not self.paused:
+                # Stop updating and rendering in the background until the window is focused again
+                self.paused = True
+                self.paused_by_focus = True
             elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_UP:
+                if event.key == pygame.K_p:
+                    self.paused = True
+                elif event.key == pygame.K_BACKSPACE:
+                    self.rewind()
+                elif event.key == pygame.K_UP:
                     self.snake.change_direction((0, -1))
                 elif event.key == pygame.K_DOWN:
                     self.snake.change_direction((0, 1))
@@ -114,8 +172,9 @@ class AdvancedGame:
         
         # Check for collisions with walls, self, or obstacles
         if self.snake.check_collision(self.screen_width, self.screen_height) or \
-                any(pos == self.snake.body[0] for pos in self.obstacles.positions):
+                self.snake.body[0] in self.obstacles.cells:
             self.game_over = True
+            self.death_cause = self.get_death_cause()
             if self.score > self.high_score:
                 self.high_score = self.score
                 self.save_high_score()
@@ -123,10 +182,45 @@ class AdvancedGame:
         # Check if the snake eats the food
         if self.snake.body[0] == self.food.position:
             self.snake.grow()
-            self.food.respawn(self.snake.body)
+            self.food.respawn(self.snake.body, self.obstacles.cells)
             self.score += 1
             self.adjust_difficulty()
     
+    def report_session(self):
+        """
+        Reports the current round to telemetry as finished. Called once per round, on restart or exit, so a death
+        that is rewound and replayed is only counted once. Rounds that end without a death are reported as 'quit'.
+        """
+        if self.telemetry is not None:
+            self.telemetry.end_session(self.score, self.difficulty_level, self.death_cause or 'quit')
+
+    def get_death_cause(self) -> str:
+        """
+        Works out what the snake's head ran into.
+        
+        :return: 'obstacle', 'self' or 'wall'.
+        """
+        head = self.snake.body[0]
+        if head in self.obstacles.cells:
+            return 'obstacle'
+        if head in self.snake.body[1:]:
+            return 'self'
+        return 'wall'
+
+    def rewind(self, ticks: int = 10) -> int:
+        """
+        Rewinds the game by the given number of ticks if a rewind buffer is attached.
+        
+        :param ticks: The number of ticks to go back.
+        :return: The number of ticks actually rewound.
+        """
+        if self.rewind_buffer is None:
+            return 0
+        rewound = self.rewind_buffer.rewind(self, ticks)
+        if not self.game_over:
+            self.death_cause = None
+        return rewound
+
     def adjust_difficulty(self):
         """
         Adjusts the game's difficulty level based on the score.
@@ -142,6 +236,7 @@ class AdvancedGame:
         if self.game_over:
             self.render_game_over()
             self.wait_for_restart_or_exit()
+            self.clock.tick()  # Restart the frame timer so the time spent waiting is not reported as one long tick
 
     def render(self):
         """
@@ -153,14 +248,15 @@ class AdvancedGame:
         self.obstacles.draw(self.screen)
         self.draw_score()
         pygame.display.update()
+        if self.recorder is not None:
+            self.recorder.capture(self.screen)
     
     def draw_score(self):
         """
         Displays the current score and high score on the screen.
         """
-        font = pygame.font.Font(None, 36)
-        score_text = font.render(f'Score: {self.score}', True, (255, 255, 255))
-        high_score_text = font.render(f'High Score: {self.high_score}', True, (255, 255, 255))
+        score_text = self.font.render(f'Score: {self.score}', True, (255, 255, 255))
+        high_score_text = self.font.render(f'High Score: {self.high_score}', True, (255, 255, 255))
         self.screen.blit(score_text, (10, 10))
         self.screen.blit(high_score_text, (10, 50))
     
@@ -168,33 +264,68 @@ class AdvancedGame:
         """
         Displays the game over message and waits for the player's input to restart or exit.
         """
-        font = pygame.font.Font(None, 72)
-        game_over_text = font.render('Game Over', True, (255, 0, 0))
+        game_over_text = self.large_font.render('Game Over', True, (255, 0, 0))
         self.screen.blit(game_over_text, (self.screen_width // 4, self.screen_height // 3))
         
-        font = pygame.font.Font(None, 36)
-        restart_text = font.render('Press R to Restart or Q to Quit', True, (255, 255, 255))
+        restart_text = self.font.render('Press R to Restart or Q to Quit', True, (255, 255, 255))
         self.screen.blit(restart_text, (self.screen_width // 4, self.screen_height // 2))
         
         pygame.display.update()
 
+    def render_paused(self):
+        """
+        Draws the pause message over the last frame.
+        """
+        paused_text = self.font.render('Paused - press P to resume', True, (255, 255, 255))
+        self.screen.blit(paused_text, (self.screen_width // 4, self.screen_height // 2))
+        pygame.display.update()
+
+    def wait_while_paused(self):
+        """
+        Blocks on the event queue until the player resumes with P, the window regains focus after an automatic pause,
+        or the player quits. Nothing is re-rendered while paused, and the frame timer restarts on resume so the pause
+        is not reported as one long tick.
+        """
+        self.render_paused()
+        while self.paused:
+            event = wait_for_event()
+            if event is None:
+                continue
+            if event.type == pygame.QUIT:
+                self.game_over = True
+                self.paused = False
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_p:
+                self.paused = False
+            elif event.type == pygame.WINDOWFOCUSGAINED and self.paused_by_focus:
+                self.paused = False
+            elif event.type == pygame.WINDOWEXPOSED:
+                pygame.display.update()
+        self.paused_by_focus = False
+        self.clock.tick()
+
     def wait_for_restart_or_exit(self):
         """
-        Waits for the player to press R to restart or Q to quit the game.
+        Waits for the player to press R to restart or Q to quit the game, sleeping on the event queue meanwhile.
         """
         waiting = True
         while waiting:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
+            event = wait_for_event()
+            if event is None:
+                continue
+            if event.type == pygame.QUIT:
+                self.game_over = True
+                waiting = False
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_r:
+                    self.reset()  # Reset the game
+                    waiting = False
+                elif event.key == pygame.K_q:
                     self.game_over = True
                     waiting = False
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_r:
-                        self.__init__(self.screen_width, self.screen_height, self.grid_size)  # Reset the game
-                        waiting = False
-                    elif event.key == pygame.K_q:
-                        self.game_over = True
-                        waiting = False
+                elif event.key == pygame.K_BACKSPACE and self.rewind():
+                    waiting = False  # Resume from before the fatal move
+            elif event.type == pygame.WINDOWEXPOSED:
+                pygame.display.update()
 
     def run(self):
         """
@@ -202,11 +333,23 @@ class AdvancedGame:
         """
         while not self.game_over:
             self.process_events()
+            if self.paused:
+                self.wait_while_paused()
+                continue
             self.update()
+            if self.rewind_buffer is not None:
+                self.rewind_buffer.record(self)
             self.render()
-            self.clock.tick(10 + self.difficulty_level)  # Control the frame rate, increasing with difficulty
+            tick_ms = self.clock.tick(10 + self.difficulty_level)  # Control the frame rate, increasing with difficulty
+            if self.telemetry is not None:
+                self.telemetry.record_tick(self.score, self.difficulty_level, tick_ms)
             self.check_game_over()
         
+        if self.recorder is not None:
+            self.recorder.close()
+        if self.telemetry is not None:
+            self.report_session()
+            self.telemetry.close()
         pygame.quit()
 
 if __name__ == "__main__":
@@ -0,0 +1,70 @@
+from typing import Dict, FrozenSet, Optional, Tuple
+
+Position = Tuple[int, int]
+Direction = Tuple[int, int]
+
+DIRECTIONS: Tuple[Direction, ...] = ((0, -1), (0, 1), (-1, 0), (1, 0))
+WALL = None  # Transition target for moves that leave a walled board
+
+_boards: Dict[Tuple[int, int, int, bool], 'Board'] = {}
+
+
+class Board:
+    def __init__(self, cols: int, rows: int, grid_size: int, wrap: bool = False):
+        """
+        Precomputes, for every grid-aligned position and direction, the position reached by one move. Walled boards
+        map moves off the edge to WALL; wrap-around (torus) boards map them to the opposite edge, so both modes cost
+        a single lookup per move. Use get_board() to share one instance between games; the tables must not be mutated.
+
+        :param cols: The number of grid columns.
+        :param rows: The number of grid rows.
+        :param grid_size: The size of the grid (the distance between neighbouring positions).
+        :param wrap: Whether moving off an edge re-enters on the opposite edge.
+        """
+        self.cols = cols
+        self.rows = rows
+        self.grid_size = grid_size
+        self.wrap = wrap
+        self.positions: FrozenSet[Position] = frozenset(
+            (col * grid_size, row * grid_size) for row in range(rows) for col in range(cols))
+        self.transitions: Dict[Direction, Dict[Position, Optional[Position]]] = {}
+        for dx, dy in DIRECTIONS:
+            table = {}
+            for row in range(rows):
+                for col in range(cols):
+                    next_col, next_row = col + dx, row + dy
+                    if wrap:
+                        table[(col * grid_size, row * grid_size)] = (
+                            (next_col % cols) * grid_size, (next_row % rows) * grid_size)
+                    elif 0 <= next_col < cols and 0 <= next_row < rows:
+                        table[(col * grid_size, row * grid_size)] = (next_col * grid_size, next_row * grid_size)
+                    else:
+                        table[(col * grid_size, row * grid_size)] = WALL
+            self.transitions[(dx, dy)] = table
+
+    def next_position(self, position: Position, direction: Direction) -> Optional[Position]:
+        """
+        Looks up the position reached by moving one step from position.
+
+        :param position: A grid-aligned position on the board.
+        :param direction: The direction to move in.
+        :return: The next position, or WALL if the move leaves a walled board or position is not on the board.
+        """
+        return self.transitions[direction].get(position, WALL)
+
+
+def get_board(cols: int, rows: int, grid_size: int, wrap: bool = False) -> Board:
+    """
+    Returns the shared board for the given dimensions, building its tables on first use.
+
+    :param cols: The number of grid columns.
+    :param rows: The number of grid rows.
+    :param grid_size: The size of the grid.
+    :param wrap: Whether the board wraps around at the edges.
+    :return: The board.
+    """
+    key = (cols, rows, grid_size, wrap)
+    board = _boards.get(key)
+    if board is None:
+        board = _boards[key] = Board(cols, rows, grid_size, wrap)
+    return board
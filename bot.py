@@ -0,0 +1,351 @@
+import math
+import random
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+from board import DIRECTIONS, WALL, Direction, get_board
+
+Cell = Tuple[int, int]
+
+
+class SimState:
+    __slots__ = ('cols', 'rows', 'board', 'walls', 'body', 'occupied', 'direction', 'food', 'score', 'alive', 'seed',
+                 '_owns_body')
+
+    def __init__(self, cols: int, rows: int, body: Iterable[Cell], direction: Direction, food: Optional[Cell],
+                 walls: FrozenSet[Cell] = frozenset(), score: int = 0, seed: int = 1, wrap: bool = False):
+        """
+        A pygame-free copy of the game rules on a grid of cells, used for planning. clone() itself is O(1): the snake
+        body is shared copy-on-write between clones, the walls and the board's transition tables are shared read-only
+        and the food RNG is a single integer. The first step() of a clone then copies the body and its occupancy
+        counts, which is O(length), so a rollout costs O(length) once plus O(1) per simulated tick.
+
+        :param cols: The number of grid columns.
+        :param rows: The number of grid rows.
+        :param body: The snake's cells, head first.
+        :param direction: The snake's current direction.
+        :param food: The food cell, or None if the board is full.
+        :param walls: The obstacle cells.
+        :param score: The current score.
+        :param seed: The non-zero state of the xorshift generator used to respawn food.
+        :param wrap: Whether the board wraps around at the edges.
+        """
+        self.cols = cols
+        self.rows = rows
+        self.board = get_board(cols, rows, 1, wrap)
+        self.walls = walls
+        self.body = deque(body)
+        self.occupied: Dict[Cell, int] = {}
+        for cell in self.body:
+            self.occupied[cell] = self.occupied.get(cell, 0) + 1
+        self.direction = direction
+        self.food = food
+        self.score = score
+        self.alive = True
+        self.seed = seed or 1
+        self._owns_body = True
+
+    @classmethod
+    def from_game(cls, game, seed: Optional[int] = None) -> 'SimState':
+        """
+        Builds a simulation state from a running Game or AdvancedGame.
+
+        :param game: The game to read the snake, food and obstacles from.
+        :param seed: The food RNG seed (random if omitted).
+        :return: The simulation state.
+        """
+        grid_size = game.snake.grid_size
+        width, height = game.screen.get_size()
+        board = game.snake.board
+        return cls(
+            cols=width // grid_size,
+            rows=height // grid_size,
+            body=[(x // grid_size, y // grid_size) for x, y in game.snake.body],
+            direction=game.snake.direction,
+            food=(game.food.position[0] // grid_size, game.food.position[1] // grid_size),
+            walls=frozenset((x // grid_size, y // grid_size) for x, y in game.obstacles.positions),
+            score=game.score,
+            seed=seed if seed is not None else random.getrandbits(32),
+            wrap=board is not None and board.wrap,
+        )
+
+    def clone(self) -> 'SimState':
+        """
+        Returns an independent copy of the state in O(1). The body is copied lazily, in O(length), by whichever copy
+        moves first.
+        """
+        other = SimState.__new__(SimState)
+        other.cols = self.cols
+        other.rows = self.rows
+        other.board = self.board
+        other.walls = self.walls
+        other.body = self.body
+        other.occupied = self.occupied
+        other.direction = self.direction
+        other.food = self.food
+        other.score = self.score
+        other.alive = self.alive
+        other.seed = self.seed
+        other._owns_body = False
+        self._owns_body = False
+        return other
+
+    def legal_directions(self) -> List[Direction]:
+        """
+        Returns the directions the snake may turn to, i.e. every direction except reversing.
+        """
+        dx, dy = self.direction
+        return [direction for direction in DIRECTIONS if direction != (-dx, -dy)]
+
+    def safe_directions(self) -> List[Direction]:
+        """
+        Returns the legal directions that do not hit a wall, an obstacle or the body on the next move.
+        """
+        head = self.body[0]
+        tail = self.body[-1]
+        transitions = self.board.transitions
+        safe = []
+        for direction in self.legal_directions():
+            cell = transitions[direction].get(head)
+            if cell is WALL or cell in self.walls:
+                continue
+            if cell in self.occupied and not (cell == tail and self.occupied[cell] == 1):
+                continue
+            safe.append(direction)
+        return safe
+
+    def step(self, direction: Direction) -> int:
+        """
+        Advances one tick the way Game.update does: turn (ignoring reversals), move, check collisions, then eat and
+        grow. Like Snake.grow, eating pushes one extra head cell forward.
+
+        :param direction: The requested direction.
+        :return: The number of food items eaten this tick (0 or 1).
+        """
+        if not self.alive:
+            return 0
+        if not self._owns_body:
+            self.body = deque(self.body)
+            self.occupied = dict(self.occupied)
+            self._owns_body = True
+        if direction != (-self.direction[0], -self.direction[1]):
+            self.direction = direction
+
+        body, occupied = self.body, self.occupied
+        transitions = self.board.transitions[self.direction]
+        head = transitions.get(body[0])
+
+        tail = body.pop()
+        if occupied[tail] == 1:
+            del occupied[tail]
+        else:
+            occupied[tail] -= 1
+
+        if head is WALL or head in occupied or head in self.walls:
+            self.alive = False
+            return 0
+        body.appendleft(head)
+        occupied[head] = occupied.get(head, 0) + 1
+
+        if head != self.food:
+            return 0
+
+        self.score += 1
+        grown = transitions[head]
+        if grown is WALL:
+            self.alive = False  # The engine only notices on the next tick, but the snake cannot recover
+            return 1
+        body.appendleft(grown)
+        occupied[grown] = occupied.get(grown, 0) + 1
+        self._respawn_food()
+        return 1
+
+    def _next_random(self, bound: int) -> int:
+        """
+        Draws a number in [0, bound) from the xorshift32 generator held in self.seed.
+        """
+        x = self.seed
+        x ^= (x << 13) & 0xFFFFFFFF
+        x ^= x >> 17
+        x ^= (x << 5) & 0xFFFFFFFF
+        self.seed = x
+        return x % bound
+
+    def _respawn_food(self):
+        """
+        Places the food on a random free cell, giving up (food = None) if none is found quickly.
+        """
+        for _ in range(1000):
+            cell = (self._next_random(self.cols), self._next_random(self.rows))
+            if cell not in self.occupied and cell not in self.walls:
+                self.food = cell
+                return
+        self.food = None
+
+
+class _Node:
+    __slots__ = ('state', 'parent', 'children', 'untried', 'visits', 'value', 'reward')
+
+    def __init__(self, state: SimState, parent: Optional['_Node'] = None, reward: int = 0):
+        self.state = state
+        self.parent = parent
+        self.children: Dict[Direction, '_Node'] = {}
+        self.untried = state.legal_directions() if state.alive else []
+        self.visits = 0
+        self.value = 0.0
+        self.reward = reward
+
+
+def _search(state: SimState, time_budget: float, max_rollouts: Optional[int], rollout_depth: int,
+            exploration: float, death_penalty: float, seed: Optional[int]) -> Tuple[Dict[Direction, Tuple[int, float]], int]:
+    """
+    Runs UCT from state until the time budget or rollout limit is spent.
+
+    :return: The (visits, total value) of each root action and the number of rollouts performed.
+    """
+    rng = random.Random(seed)
+    root = _Node(state.clone())
+    deadline = time.perf_counter() + time_budget
+    rollouts = 0
+
+    while (max_rollouts is None or rollouts < max_rollouts) and time.perf_counter() < deadline:
+        node = root
+        path_reward = 0.0
+
+        # Selection
+        while not node.untried and node.children:
+            log_visits = math.log(node.visits)
+            node = max(node.children.values(),
+                       key=lambda child: child.value / child.visits + exploration * math.sqrt(log_visits / child.visits))
+            path_reward += node.reward
+
+        # Expansion
+        if node.untried:
+            direction = node.untried.pop(rng.randrange(len(node.untried)))
+            child_state = node.state.clone()
+            reward = child_state.step(direction)
+            child = _Node(child_state, node, reward)
+            node.children[direction] = child
+            node = child
+            path_reward += reward
+
+        # Rollout
+        sim = node.state.clone()
+        value = path_reward
+        for _ in range(rollout_depth):
+            if not sim.alive:
+                break
+            safe = sim.safe_directions()
+            value += sim.step(rng.choice(safe) if safe else sim.direction)
+        if not sim.alive:
+            value -= death_penalty
+        elif sim.food is not None:
+            # Credit rollouts that end close to the food, so the search is not blind when no food is reached
+            head = sim.body[0]
+            value += 1.0 - (abs(head[0] - sim.food[0]) + abs(head[1] - sim.food[1])) / (sim.cols + sim.rows)
+
+        # Backpropagation
+        while node is not None:
+            node.visits += 1
+            node.value += value
+            node = node.parent
+        rollouts += 1
+
+    return {direction: (child.visits, child.value) for direction, child in root.children.items()}, rollouts
+
+
+class MCTSBot:
+    def __init__(self, time_budget: float = 0.5, max_rollouts: Optional[int] = None, rollout_depth: int = 30,
+                 exploration: float = 1.4, death_penalty: float = 5.0, processes: int = 0):
+        """
+        A Monte Carlo tree search planner used as a reference player. One process runs roughly 4,000-7,000 rollouts
+        per second on a 30x20 board with a short snake (see rollouts_per_second), so the default budget gives a few
+        thousand rollouts per move. Lower the budget for real-time play, or add processes to search more per move.
+
+        :param time_budget: The seconds spent planning each move.
+        :param max_rollouts: An optional cap on rollouts per move (per process).
+        :param rollout_depth: The number of random ticks simulated after leaving the tree.
+        :param exploration: The UCT exploration constant.
+        :param death_penalty: The value subtracted from rollouts that end with the snake dead.
+        :param processes: The number of worker processes for root-parallel search (0 searches in this process).
+        """
+        self.time_budget = time_budget
+        self.max_rollouts = max_rollouts
+        self.rollout_depth = rollout_depth
+        self.exploration = exploration
+        self.death_penalty = death_penalty
+        self.processes = processes
+        self.executor = ProcessPoolExecutor(max_workers=processes) if processes > 0 else None
+        self.last_rollouts = 0
+        self.last_elapsed = 0.0
+
+    @property
+    def rollouts_per_second(self) -> float:
+        """
+        The rollout throughput of the last call to plan(), summed over all processes.
+        """
+        return self.last_rollouts / self.last_elapsed if self.last_elapsed else 0.0
+
+    def plan(self, state: SimState) -> Direction:
+        """
+        Searches from state and returns the most visited direction.
+
+        :param state: The state to plan from (left unchanged).
+        :return: The direction to move in.
+        """
+        start = time.perf_counter()
+        args = (self.time_budget, self.max_rollouts, self.rollout_depth, self.exploration, self.death_penalty)
+        if self.executor is None:
+            results = [_search(state, *args, None)]
+        else:
+            seeds = [random.getrandbits(32) for _ in range(self.processes)]
+            futures = [self.executor.submit(_search, state, *args, seed) for seed in seeds]
+            results = [future.result() for future in futures]
+        self.last_elapsed = time.perf_counter() - start
+
+        visits: Dict[Direction, int] = {}
+        self.last_rollouts = 0
+        for stats, rollouts in results:
+            self.last_rollouts += rollouts
+            for direction, (count, _) in stats.items():
+                visits[direction] = visits.get(direction, 0) + count
+
+        if not visits:
+            return state.direction
+        return max(visits, key=visits.get)
+
+    def choose_direction(self, game) -> Direction:
+        """
+        Plans a move for a running Game or AdvancedGame.
+
+        :param game: The game to plan for.
+        :return: The direction to pass to game.snake.change_direction.
+        """
+        return self.plan(SimState.from_game(game))
+
+    def close(self):
+        """
+        Shuts down the worker processes, if any.
+        """
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+
+if __name__ == "__main__":
+    # Headless benchmark: let the bot play one game and report its score and throughput
+    bot = MCTSBot(time_budget=0.05)  # Much shorter than the default so a full game finishes quickly
+    state = SimState(cols=30, rows=20, body=[(15, 10), (14, 10), (13, 10)], direction=(1, 0), food=(20, 10),
+                     seed=random.getrandbits(32))
+    moves = 0
+    total_rollouts = 0
+    total_elapsed = 0.0
+    while state.alive and moves < 500:
+        state.step(bot.plan(state))
+        moves += 1
+        total_rollouts += bot.last_rollouts
+        total_elapsed += bot.last_elapsed
+    bot.close()
+    print(f"Score: {state.score} in {moves} moves, {total_rollouts / total_elapsed:.0f} rollouts/sec, "
+          f"{total_rollouts / moves:.0f} rollouts/move")
@@ -0,0 +1,113 @@
+import os
+import queue
+import threading
+import pygame
+from typing import Optional
+
+try:
+    import numpy
+except ImportError:  # pygame.surfarray needs numpy
+    numpy = None
+
+
+class FrameRecorder:
+    def __init__(self, width: int, height: int, output_dir: str = 'capture', capacity: int = 32,
+                 fmt: str = 'png', fps: int = 10, max_gif_frames: int = 300):
+        """
+        Records frames of the game screen without slowing the game loop. Frames are copied into a fixed ring of
+        preallocated buffers and encoded by a background thread; when every buffer is still waiting to be encoded the
+        new frame is dropped instead of blocking the caller. Works with SDL's dummy video driver.
+
+        A GIF is only written once recording stops, so GIF recordings are capped at max_gif_frames frames; the encoder
+        thread keeps them as palette images (one byte per pixel) and writes the file itself when closed. Later frames
+        are dropped and counted in frames_dropped. Use the PNG sequence for longer recordings.
+
+        :param width: The width of the captured surface.
+        :param height: The height of the captured surface.
+        :param output_dir: The directory the frames (or the GIF) are written to.
+        :param capacity: The number of preallocated frame buffers.
+        :param fmt: 'png' for a numbered image sequence, or 'gif' for a single animated GIF (requires Pillow).
+        :param fps: The playback rate of the GIF.
+        :param max_gif_frames: The maximum number of frames kept for a GIF.
+        """
+        if numpy is None:
+            raise ImportError("FrameRecorder requires numpy for pygame.surfarray")
+        if fmt not in ('png', 'gif'):
+            raise ValueError(f"Unsupported capture format: {fmt}")
+        if fmt == 'gif':
+            from PIL import Image  # noqa: F401 -- fail early rather than in the encoder thread
+
+        self.width = width
+        self.height = height
+        self.output_dir = output_dir
+        self.fmt = fmt
+        self.fps = fps
+        self.max_gif_frames = max_gif_frames
+        self.buffers = [numpy.empty((width, height, 3), dtype=numpy.uint8) for _ in range(capacity)]
+        self.frames_captured = 0
+        self.frames_dropped = 0
+
+        self._free_slots = queue.SimpleQueue()
+        for slot in range(capacity):
+            self._free_slots.put(slot)
+        self._ready_slots = queue.SimpleQueue()
+        self._gif_frames = []
+
+        os.makedirs(output_dir, exist_ok=True)
+        self._encoder = threading.Thread(target=self._encode_frames, name='FrameRecorder', daemon=True)
+        self._encoder.start()
+
+    def capture(self, surface: pygame.Surface) -> bool:
+        """
+        Copies the surface into a free buffer and hands it to the encoder.
+
+        :param surface: The surface to capture, usually the display surface.
+        :return: True if the frame was queued, False if it was dropped because all buffers were busy or the GIF
+                 frame limit was reached.
+        """
+        if self.fmt == 'gif' and self.frames_captured >= self.max_gif_frames:
+            self.frames_dropped += 1
+            return False
+        try:
+            slot = self._free_slots.get_nowait()
+        except queue.Empty:
+            self.frames_dropped += 1
+            return False
+        pygame.pixelcopy.surface_to_array(self.buffers[slot], surface)
+        self._ready_slots.put((slot, self.frames_captured))
+        self.frames_captured += 1
+        return True
+
+    def close(self):
+        """
+        Waits for the encoder thread to finish the queued frames and, in GIF mode, to write the GIF.
+        """
+        self._ready_slots.put(None)
+        self._encoder.join()
+
+    def _encode_frames(self):
+        """
+        Runs on the encoder thread, writing each queued frame and returning its buffer to the free pool.
+        """
+        frame_surface: Optional[pygame.Surface] = None
+        while True:
+            item = self._ready_slots.get()
+            if item is None:
+                break
+            slot, frame_number = item
+            buffer = self.buffers[slot]
+            if self.fmt == 'gif':
+                from PIL import Image
+                self._gif_frames.append(Image.fromarray(buffer.swapaxes(0, 1).copy()).quantize())
+            else:
+                if frame_surface is None:
+                    frame_surface = pygame.Surface((self.width, self.height), depth=24)
+                pygame.surfarray.blit_array(frame_surface, buffer)
+                pygame.image.save(frame_surface, os.path.join(self.output_dir, f'frame_{frame_number:06d}.png'))
+            self._free_slots.put(slot)
+
+        if self._gif_frames:
+            first, *rest = self._gif_frames
+            first.save(os.path.join(self.output_dir, 'capture.gif'), save_all=True, append_images=rest,
+                       duration=1000 // self.fps, loop=0)
+            self._gif_frames = []
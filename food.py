@@ -1,5 +1,5 @@
 import pygame
-from typing import Tuple, List
+from typing import Collection, Tuple, List
 from utils import random_position
 
 class Food:
@@ -18,15 +18,16 @@ class Food:
         self.color = color
         self.position = random_position(grid_size, screen_width, screen_height)
     
-    def respawn(self, snake_body: List[Tuple[int, int]]):
+    def respawn(self, snake_body: List[Tuple[int, int]], obstacles: Collection[Tuple[int, int]] = ()):
         """
         Repositions the food to a new random location on the screen.
         
         :param snake_body: A list of tuples representing the coordinates of the snake's body.
+        :param obstacles: The obstacle positions to avoid, ideally a set for fast lookups.
         """
         while True:
             new_position = random_position(self.grid_size, self.screen_width, self.screen_height)
-            if new_position not in snake_body:
+            if new_position not in snake_body and new_position not in obstacles:
                 self.position = new_position
                 break
     
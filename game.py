@@ -1,18 +1,20 @@
 import pygame
 from snake import Snake
 from food import Food
-from utils import draw_text, initialize_game
+from utils import draw_text, initialize_game, spawn_position, wait_for_event
 from advanced import Obstacle
 from sound import SoundManager  # Import the SoundManager class
 
 class Game:
-    def __init__(self, screen_width=600, screen_height=400, grid_size=20):
+    def __init__(self, screen_width=600, screen_height=400, grid_size=20, level=None, wrap=False):
         """
         Initializes the game by creating the necessary game objects and setting up the environment.
         
         :param screen_width: Width of the game screen.
         :param screen_height: Height of the game screen.
         :param grid_size: Size of the grid units.
+        :param level: A pre-generated level (see level.py) to play on instead of random obstacles.
+        :param wrap: Whether the snake wraps around the screen edges instead of dying on them.
         """
         pygame.init()
         self.screen_width = 800
@@ -20,14 +22,35 @@ class Game:
         self.screen = pygame.display.set_mode((self.screen_width, self.screen_height))
         pygame.display.set_caption("Snake Game")
         
-        self.screen, self.clock, self.snake, self.food = initialize_game(screen_width, screen_height, grid_size)
-        self.obstacles = Obstacle(screen_width, screen_height, grid_size)
+        self.screen, self.clock, self.snake, self.food = initialize_game(screen_width, screen_height, grid_size, wrap)
+        self.level = level
+        self.obstacles = Obstacle(screen_width, screen_height, grid_size, level=self.level)
+        self.food.respawn(self.snake.body, self.obstacles.cells)  # Keep the first food off obstacles too
         self.score = 0
         self.game_over = False
+        self.paused = False
+        self.paused_by_focus = False
+        self.recorder = None  # Optional capture.FrameRecorder fed by render()
         
         # Initialize sound manager
         # self.sound_manager = SoundManager()
 
+    def reset(self):
+        """
+        Resets the game state for a new round while reusing the display surface, clock and Pygame subsystems.
+        """
+        screen_width, screen_height = self.screen.get_width(), self.screen.get_height()
+        grid_size = self.snake.grid_size
+        self.snake = Snake(initial_position=spawn_position(screen_width, screen_height, grid_size), grid_size=grid_size,
+                           board=self.snake.board)
+        self.food = Food(screen_width=screen_width, screen_height=screen_height, grid_size=grid_size)
+        self.obstacles = Obstacle(screen_width, screen_height, grid_size, level=self.level)
+        self.food.respawn(self.snake.body, self.obstacles.cells)  # Keep the first food off obstacles too
+        self.score = 0
+        self.game_over = False
+        self.paused = False
+        self.paused_by_focus = False
+
     def process_events(self):
         """
         Handles all player inputs, primarily controlling the snake's direction.
@@ -35,8 +58,14 @@ class Game:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.game_over = True
+            elif event.type == pygame.WINDOWFOCUSLOST and not self.paused:
+                # Stop updating and rendering in the background until the window is focused again
+                self.paused = True
+                self.paused_by_focus = True
             elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_UP:
+                if event.key == pygame.K_p:
+                    self.paused = True
+                elif event.key == pygame.K_UP:
                     self.snake.change_direction((0, -1))
                 elif event.key == pygame.K_DOWN:
                     self.snake.change_direction((0, 1))
@@ -51,13 +80,13 @@ class Game:
         """
         self.snake.move()
         
-        if self.snake.body[0] in self.obstacles.positions:
+        if self.snake.body[0] in self.obstacles.cells:
             print(f"Collision detected with obstacle at {self.snake.body[0]}")
             self.game_over = True
         
         # Check for collisions with walls, self, or obstacles
         if self.snake.check_collision(self.screen.get_width(), self.screen.get_height()) or \
-                any(pos == self.snake.body[0] for pos in self.obstacles.positions):
+                self.snake.body[0] in self.obstacles.cells:
             self.game_over = True
             
         
@@ -65,7 +94,7 @@ class Game:
         if self.snake.body[0] == self.food.position:
             print("Food eaten!")
             self.snake.grow()
-            self.food.respawn(self.snake.body)
+            self.food.respawn(self.snake.body, self.obstacles.cells)
             self.score += 1
             print(f"Score updated: {self.score}")
     
@@ -79,6 +108,8 @@ class Game:
         self.obstacles.draw(self.screen)
         self.draw_score()
         pygame.display.update()
+        if self.recorder is not None:
+            self.recorder.capture(self.screen)
 
     def draw_score(self):
         """
@@ -86,23 +117,55 @@ class Game:
         """
         draw_text(self.screen, f'Score: {self.score}', (10, 10), 36)
 
+    def render_paused(self):
+        """
+        Draws the pause message over the last frame.
+        """
+        draw_text(self.screen, 'Paused - press P to resume', (10, 50), 36)
+        pygame.display.update()
+
+    def wait_while_paused(self):
+        """
+        Blocks on the event queue until the player resumes with P, the window regains focus after an automatic pause,
+        or the player quits. Nothing is re-rendered while paused.
+        """
+        self.render_paused()
+        while self.paused:
+            event = wait_for_event()
+            if event is None:
+                continue
+            if event.type == pygame.QUIT:
+                self.game_over = True
+                self.paused = False
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_p:
+                self.paused = False
+            elif event.type == pygame.WINDOWFOCUSGAINED and self.paused_by_focus:
+                self.paused = False
+            elif event.type == pygame.WINDOWEXPOSED:
+                pygame.display.update()
+        self.paused_by_focus = False
+
     def wait_for_restart_or_exit(self):
         """
-        Waits for the player to press R to restart or Q to quit the game.
+        Waits for the player to press R to restart or Q to quit the game, sleeping on the event queue meanwhile.
         """
         waiting = True
         while waiting:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
+            event = wait_for_event()
+            if event is None:
+                continue
+            if event.type == pygame.QUIT:
+                self.game_over = True
+                waiting = False
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_r:
+                    self.reset()  # Reset the game
+                    waiting = False
+                elif event.key == pygame.K_q:
                     self.game_over = True
                     waiting = False
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_r:
-                        self.__init__(self.screen.get_width(), self.screen.get_height(), self.snake.grid_size)  # Reset the game
-                        waiting = False
-                    elif event.key == pygame.K_q:
-                        self.game_over = True
-                        waiting = False
+            elif event.type == pygame.WINDOWEXPOSED:
+                pygame.display.update()
 
     def run(self):
         """
@@ -110,10 +173,15 @@ class Game:
         """
         while not self.game_over:
             self.process_events()
+            if self.paused:
+                self.wait_while_paused()
+                continue
             self.update()
             self.render()
             self.clock.tick(10)  # Control the frame rate to 10 FPS
         
+        if self.recorder is not None:
+            self.recorder.close()
         pygame.quit()
 
 if __name__ == "__main__":
@@ -0,0 +1,247 @@
+import os
+import random
+from collections import deque
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+Cell = Tuple[int, int]
+
+WALL_CHAR = '#'
+FREE_CHAR = '.'
+
+_level_cache: Dict[str, 'Level'] = {}
+
+
+class Level:
+    def __init__(self, cols: int, rows: int, walls: Iterable[Cell]):
+        """
+        Holds an immutable board layout, described in grid cells rather than pixels.
+
+        :param cols: The number of grid columns.
+        :param rows: The number of grid rows.
+        :param walls: The (col, row) cells occupied by walls.
+        """
+        self.cols = cols
+        self.rows = rows
+        self.walls: FrozenSet[Cell] = frozenset(walls)
+
+    def positions(self, grid_size: int) -> List[Tuple[int, int]]:
+        """
+        Converts the wall cells into pixel positions aligned with the grid.
+
+        :param grid_size: The size of the grid.
+        :return: A list of (x, y) pixel positions, in row-major order.
+        """
+        return [(col * grid_size, row * grid_size) for col, row in sorted(self.walls, key=lambda cell: (cell[1], cell[0]))]
+
+    def is_connected(self) -> bool:
+        """
+        Checks that every free cell can be reached from every other free cell.
+
+        :return: True if the free cells form a single region.
+        """
+        free_count = self.cols * self.rows - len(self.walls)
+        if free_count == 0:
+            return True
+        start = next((col, row) for row in range(self.rows) for col in range(self.cols) if (col, row) not in self.walls)
+        return len(flood_fill(self.cols, self.rows, self.walls, start)) == free_count
+
+    def save(self, path: str):
+        """
+        Writes the level as a header line followed by one line of '#'/'.' characters per row.
+
+        :param path: The file to write.
+        """
+        lines = [f'{self.cols} {self.rows}']
+        for row in range(self.rows):
+            lines.append(''.join(WALL_CHAR if (col, row) in self.walls else FREE_CHAR for col in range(self.cols)))
+        with open(path, 'w') as file:
+            file.write('\n'.join(lines) + '\n')
+
+    @classmethod
+    def load(cls, path: str) -> 'Level':
+        """
+        Reads a level previously written by save().
+
+        :param path: The file to read.
+        :return: The loaded level.
+        """
+        with open(path, 'r') as file:
+            cols, rows = (int(value) for value in file.readline().split())
+            walls = []
+            for row in range(rows):
+                line = file.readline().rstrip('\n')
+                if len(line) != cols:
+                    raise ValueError(f"Row {row} of {path} has {len(line)} cells, expected {cols}")
+                walls.extend((col, row) for col, char in enumerate(line) if char == WALL_CHAR)
+        return cls(cols, rows, walls)
+
+
+class _DisjointSet:
+    def __init__(self, size: int):
+        """
+        A union-find structure over the integers 0..size-1.
+
+        :param size: The number of elements.
+        """
+        self.parent = list(range(size))
+        self.size = [1] * size
+
+    def find(self, item: int) -> int:
+        parent = self.parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, a: int, b: int) -> bool:
+        """
+        Merges the sets containing a and b.
+
+        :return: True if they were in different sets.
+        """
+        a, b = self.find(a), self.find(b)
+        if a == b:
+            return False
+        if self.size[a] < self.size[b]:
+            a, b = b, a
+        self.parent[b] = a
+        self.size[a] += self.size[b]
+        return True
+
+
+def flood_fill(cols: int, rows: int, walls: Iterable[Cell], start: Cell) -> Set[Cell]:
+    """
+    Finds every free cell reachable from start by orthogonal moves.
+
+    :param cols: The number of grid columns.
+    :param rows: The number of grid rows.
+    :param walls: The wall cells.
+    :param start: The cell to start from.
+    :return: The set of reachable cells (empty if start is a wall).
+    """
+    if start in walls:
+        return set()
+    reached = {start}
+    queue = deque([start])
+    while queue:
+        col, row = queue.popleft()
+        for next_cell in ((col + 1, row), (col - 1, row), (col, row + 1), (col, row - 1)):
+            if (0 <= next_cell[0] < cols and 0 <= next_cell[1] < rows and
+                    next_cell not in walls and next_cell not in reached):
+                reached.add(next_cell)
+                queue.append(next_cell)
+    return reached
+
+
+def spawn_corridor(cols: int, rows: int, spawn: Cell, snake_length: int = 3, clearance: int = 3) -> Set[Cell]:
+    """
+    Returns the cells that must stay free around the snake's spawn point: the initial body, which extends to the left
+    of the head, plus a few cells ahead of the head in the starting direction (right).
+
+    :param cols: The number of grid columns.
+    :param rows: The number of grid rows.
+    :param spawn: The cell of the snake's head.
+    :param snake_length: The initial length of the snake.
+    :param clearance: The number of free cells kept ahead of the head.
+    :return: The set of corridor cells inside the board.
+    """
+    col, row = spawn
+    return {(c, row) for c in range(col - snake_length + 1, col + clearance + 1) if 0 <= c < cols and 0 <= row < rows}
+
+
+def _seal_unreachable(cols: int, rows: int, walls: Set[Cell], spawn: Cell) -> Set[Cell]:
+    """
+    Turns every free cell that cannot be reached from the spawn into a wall, so the board has a single free region.
+    """
+    reachable = flood_fill(cols, rows, walls, spawn)
+    return {(col, row) for row in range(rows) for col in range(cols) if (col, row) not in reachable}
+
+
+def generate_walls(cols: int, rows: int, number_of_walls: int, spawn: Cell,
+                   rng: Optional[random.Random] = None) -> Level:
+    """
+    Scatters distinct wall cells over the board, keeping the spawn corridor clear. Pockets of free cells that end up
+    cut off from the spawn are filled in, so the result may hold a few more walls than requested.
+
+    :param cols: The number of grid columns.
+    :param rows: The number of grid rows.
+    :param number_of_walls: The number of walls to scatter.
+    :param spawn: The cell of the snake's head.
+    :param rng: The random generator to use (defaults to the random module).
+    :return: The generated level.
+    """
+    rng = rng or random
+    corridor = spawn_corridor(cols, rows, spawn)
+    candidates = [(col, row) for row in range(rows) for col in range(cols) if (col, row) not in corridor]
+    walls = set(rng.sample(candidates, min(number_of_walls, len(candidates))))
+    return Level(cols, rows, _seal_unreachable(cols, rows, walls, spawn))
+
+
+def generate_maze(cols: int, rows: int, spawn: Cell, rng: Optional[random.Random] = None) -> Level:
+    """
+    Carves a maze with randomized Kruskal's algorithm. Rooms sit on cells with even coordinates and a union-find
+    structure decides which passages between neighbouring rooms to open, so every room is reachable without loops.
+    The spawn corridor is cleared afterwards.
+
+    :param cols: The number of grid columns.
+    :param rows: The number of grid rows.
+    :param spawn: The cell of the snake's head.
+    :param rng: The random generator to use (defaults to the random module).
+    :return: The generated level.
+    """
+    rng = rng or random
+    room_cols, room_rows = (cols + 1) // 2, (rows + 1) // 2
+    free = {(2 * c, 2 * r) for r in range(room_rows) for c in range(room_cols)}
+
+    edges = []
+    for r in range(room_rows):
+        for c in range(room_cols):
+            if c + 1 < room_cols:
+                edges.append((r * room_cols + c, r * room_cols + c + 1, (2 * c + 1, 2 * r)))
+            if r + 1 < room_rows:
+                edges.append((r * room_cols + c, (r + 1) * room_cols + c, (2 * c, 2 * r + 1)))
+    rng.shuffle(edges)
+
+    rooms = _DisjointSet(room_cols * room_rows)
+    for a, b, passage in edges:
+        if rooms.union(a, b):
+            free.add(passage)
+
+    free |= spawn_corridor(cols, rows, spawn)
+    walls = {(col, row) for row in range(rows) for col in range(cols) if (col, row) not in free}
+    return Level(cols, rows, _seal_unreachable(cols, rows, walls, spawn))
+
+
+def load_or_generate(cache_dir: str, cols: int, rows: int, spawn: Cell, number_of_walls: int = 0,
+                     maze: bool = False, seed: int = 0) -> Level:
+    """
+    Returns the level for the given parameters, loading it from memory or from cache_dir when it was generated before
+    and generating and saving it otherwise.
+
+    :param cache_dir: The directory holding serialized levels.
+    :param cols: The number of grid columns.
+    :param rows: The number of grid rows.
+    :param spawn: The cell of the snake's head.
+    :param number_of_walls: The number of walls to scatter (ignored for mazes).
+    :param maze: Whether to generate a maze instead of scattered walls.
+    :param seed: The seed of the level, part of the cache key.
+    :return: The level.
+    """
+    kind = 'maze' if maze else f'walls{number_of_walls}'
+    path = os.path.join(cache_dir, f'{kind}_{cols}x{rows}_{spawn[0]}-{spawn[1]}_{seed}.lvl')
+    if path in _level_cache:
+        return _level_cache[path]
+
+    if os.path.exists(path):
+        level = Level.load(path)
+    else:
+        rng = random.Random(seed)
+        if maze:
+            level = generate_maze(cols, rows, spawn, rng)
+        else:
+            level = generate_walls(cols, rows, number_of_walls, spawn, rng)
+        os.makedirs(cache_dir, exist_ok=True)
+        level.save(path)
+
+    _level_cache[path] = level
+    return level
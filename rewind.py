@@ -0,0 +1,168 @@
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+Position = Tuple[int, int]
+
+
+class RewindBuffer:
+    def __init__(self, capacity: int = 4096, keyframe_interval: int = 256):
+        """
+        Records a live AdvancedGame tick by tick so it can be rewound and stepped forward again. Each tick stores
+        only a delta: the head cells added, the tail cell dropped, and the food and scalar state (direction, score,
+        difficulty, speed, game over) before and after, sharing unchanged values between ticks. Full snapshots are
+        kept every keyframe_interval ticks so long seeks start from the nearest snapshot instead of replaying every
+        delta. Memory is bounded by capacity; the oldest ticks are forgotten first.
+
+        :param capacity: The number of ticks that can be rewound.
+        :param keyframe_interval: The number of ticks between full snapshots.
+        """
+        self.capacity = capacity
+        self.keyframe_interval = keyframe_interval
+        self._deltas: List[Optional[tuple]] = [None] * capacity
+        self._keyframes: Dict[int, tuple] = {}
+        self.clear()
+
+    def clear(self):
+        """
+        Forgets all recorded ticks. The next call to record() starts a new history.
+        """
+        self._deltas = [None] * self.capacity
+        self._keyframes.clear()
+        self.oldest_tick = 0
+        self.newest_tick = 0
+        self.current_tick = 0
+        self._head: Optional[Position] = None
+        self._tail: Optional[Position] = None
+        self._length = 0
+        self._food: Optional[Position] = None
+        self._scalars: Optional[tuple] = None
+
+    def record(self, game):
+        """
+        Records the state reached by the tick that was just played. Call once per update. Rewound ticks that were
+        not stepped forward again are discarded, and a change that is not a single tick of movement (such as a
+        restart) starts a new history.
+
+        :param game: The game to record.
+        """
+        body = game.snake.body
+        scalars = self._read_scalars(game)
+        if scalars == self._scalars:
+            scalars = self._scalars  # Share the tuple between ticks where nothing changed
+
+        delta = self._diff(body) if self._head is not None else None
+        if delta is None:
+            self.clear()
+            self._keyframes[0] = (tuple(body), game.food.position, scalars)
+        else:
+            heads, dropped = delta
+            tick = self.current_tick + 1
+            truncated = tick <= self.newest_tick
+            self._deltas[tick % self.capacity] = (heads, dropped, self._food, game.food.position, self._scalars, scalars)
+            self.current_tick = self.newest_tick = tick
+            if self.newest_tick - self.oldest_tick > self.capacity:
+                self.oldest_tick = self.newest_tick - self.capacity
+            if truncated or tick % self.keyframe_interval == 0:
+                for old_tick in [t for t in self._keyframes if t < self.oldest_tick or t > tick]:
+                    del self._keyframes[old_tick]
+            if tick % self.keyframe_interval == 0:
+                self._keyframes[tick] = (tuple(body), game.food.position, scalars)
+
+        self._remember(body, game.food.position, scalars)
+
+    def rewind(self, game, n: int = 1) -> int:
+        """
+        Moves the game back by up to n recorded ticks.
+
+        :param game: The game to rewind.
+        :param n: The number of ticks to go back.
+        :return: The number of ticks actually rewound.
+        """
+        target = max(self.oldest_tick, self.current_tick - n)
+        rewound = self.current_tick - target
+        self.seek(game, target)
+        return rewound
+
+    def step_forward(self, game, n: int = 1) -> int:
+        """
+        Replays up to n previously rewound ticks.
+
+        :param game: The game to move forward.
+        :param n: The number of ticks to replay.
+        :return: The number of ticks actually replayed.
+        """
+        target = min(self.newest_tick, self.current_tick + n)
+        replayed = target - self.current_tick
+        self.seek(game, target)
+        return replayed
+
+    def seek(self, game, tick: int):
+        """
+        Restores the game to the state recorded at the given tick, starting from whichever is closer: the current
+        state or the nearest keyframe at or before the tick.
+
+        :param game: The game to restore.
+        :param tick: A tick between oldest_tick and newest_tick.
+        """
+        if not self.oldest_tick <= tick <= self.newest_tick:
+            raise ValueError(f"Tick {tick} is outside the recorded range {self.oldest_tick}..{self.newest_tick}")
+        if tick == self.current_tick:
+            return
+
+        keyframe_tick = max((t for t in self._keyframes if self.oldest_tick <= t <= tick), default=None)
+        if keyframe_tick is not None and tick - keyframe_tick < abs(tick - self.current_tick):
+            keyframe_body, food, scalars = self._keyframes[keyframe_tick]
+            body = deque(keyframe_body)
+            position = keyframe_tick
+        else:
+            body = deque(game.snake.body)
+            food, scalars = game.food.position, self._scalars
+            position = self.current_tick
+
+        while position > tick:
+            heads, dropped, food, _, scalars, _ = self._deltas[position % self.capacity]
+            for _ in heads:
+                body.popleft()
+            if dropped is not None:
+                body.append(dropped)
+            position -= 1
+        while position < tick:
+            position += 1
+            heads, dropped, _, food, _, scalars = self._deltas[position % self.capacity]
+            if dropped is not None:
+                body.pop()
+            body.extendleft(heads)
+
+        body = list(body)
+        game.snake.body = body
+        game.food.position = food
+        game.snake.direction, game.score, game.difficulty_level, game.snake.speed, game.game_over = scalars
+        self.current_tick = tick
+        self._remember(body, food, scalars)
+
+    def _diff(self, body: List[Position]) -> Optional[Tuple[Tuple[Position, ...], Optional[Position]]]:
+        """
+        Works out how the body changed since the last recorded tick.
+
+        :return: The head cells added (oldest first) and the tail cell dropped, or None if the change is not a
+                 single tick of movement.
+        """
+        for added in (1, 2):  # Snake.grow adds a second head on the tick the food is eaten
+            if len(body) > added and body[added] == self._head:
+                dropped = self._length + added - len(body)
+                if dropped == 0:
+                    return tuple(reversed(body[:added])), None
+                if dropped == 1:
+                    return tuple(reversed(body[:added])), self._tail
+        return None
+
+    def _remember(self, body: List[Position], food: Position, scalars: tuple):
+        self._head = body[0]
+        self._tail = body[-1]
+        self._length = len(body)
+        self._food = food
+        self._scalars = scalars
+
+    @staticmethod
+    def _read_scalars(game) -> tuple:
+        return (game.snake.direction, game.score, game.difficulty_level, game.snake.speed, game.game_over)
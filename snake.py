@@ -1,33 +1,49 @@
 import pygame
-from typing import List, Tuple
+from typing import List, Optional, Tuple
+from board import Board
 
 class Snake:
-    def __init__(self, initial_position: Tuple[int, int], grid_size: int = 20, initial_length: int = 3):
+    def __init__(self, initial_position: Tuple[int, int], grid_size: int = 20, initial_length: int = 3,
+                 board: Optional[Board] = None):
         """
         Initializes the snake's attributes when a new instance is created.
         
         :param initial_position: The starting position of the snake's head.
         :param grid_size: The size of the grid (used to align the snake on the grid).
         :param initial_length: The initial length of the snake.
+        :param board: The shared transition tables used for movement and wall collisions. Without a board, the
+                      head position is computed directly and checked against the screen bounds.
         """
         self.grid_size = grid_size
+        self.board = board
         self.direction = (1, 0)  # Start by moving right
         self.body = [(
             initial_position[0] - i * grid_size, initial_position[1]
         ) for i in range(initial_length)]
         self.speed = 10  # Snake's movement speed (can be adjusted)
 
+    def next_head(self) -> Tuple[int, int]:
+        """
+        Computes the position the head moves to next, looking it up in the board's transition table when possible.
+        
+        :return: The new head position, which lies off the board when the snake runs into a wall.
+        """
+        head = self.body[0]
+        if self.board is not None:
+            new_head = self.board.transitions[self.direction].get(head)
+            if new_head is not None:
+                return new_head
+        return (
+            head[0] + self.direction[0] * self.grid_size,
+            head[1] + self.direction[1] * self.grid_size
+        )
+
     def move(self):
         """
         Updates the snake's position on the screen by moving it in the current direction.
         """
-        # Calculate new head position
-        new_head = (
-            self.body[0][0] + self.direction[0] * self.grid_size,
-            self.body[0][1] + self.direction[1] * self.grid_size
-        )
         # Insert new head position
-        self.body.insert(0, new_head)
+        self.body.insert(0, self.next_head())
         # Remove the last segment unless snake has eaten
         self.body.pop()
 
@@ -36,11 +52,7 @@ class Snake:
         Increases the length of the snake when it eats food.
         """
         # Add a new segment to the snake by not removing the tail
-        new_head = (
-            self.body[0][0] + self.direction[0] * self.grid_size,
-            self.body[0][1] + self.direction[1] * self.grid_size
-        )
-        self.body.insert(0, new_head)
+        self.body.insert(0, self.next_head())
 
     def check_collision(self, screen_width: int, screen_height: int) -> bool:
         """
@@ -53,7 +65,10 @@ class Snake:
         head_x, head_y = self.body[0]
 
         # 检查是否碰撞到墙壁
-        if (head_x < 0 or head_x >= screen_width or
+        if self.board is not None:
+            if self.body[0] not in self.board.positions:
+                return True
+        elif (head_x < 0 or head_x >= screen_width or
             head_y < 0 or head_y >= screen_height):
             return True
 
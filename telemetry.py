@@ -0,0 +1,226 @@
+import json
+import math
+import threading
+import time
+from collections import deque
+from typing import Dict, Optional
+
+_TICK = 0
+_SESSION_END = 1
+
+
+class QuantileSketch:
+    def __init__(self, growth: float = 1.05):
+        """
+        A histogram with logarithmically sized buckets. Memory grows with the logarithm of the value range rather than
+        the number of samples, and quantiles are accurate to within about half the bucket growth factor.
+
+        :param growth: The ratio between the bounds of consecutive buckets.
+        """
+        self.growth = growth
+        self._log_growth = math.log(growth)
+        self.reset()
+
+    def reset(self):
+        """
+        Forgets all samples.
+        """
+        self.buckets: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float):
+        """
+        Adds one sample. Values at or below zero share a single bucket.
+
+        :param value: The sample.
+        """
+        index = math.floor(math.log(value) / self._log_growth) if value > 0 else None
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimates the q-th quantile of the samples.
+
+        :param q: The quantile, between 0 and 1.
+        :return: The estimate (the midpoint of the matching bucket, clamped to the observed range), or None if empty.
+        """
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        seen = self.buckets.get(None, 0)
+        if rank < seen:
+            return max(self.min, 0.0)
+        for index in sorted(i for i in self.buckets if i is not None):
+            seen += self.buckets[index]
+            if rank < seen:
+                midpoint = (self.growth ** index + self.growth ** (index + 1)) / 2
+                return min(max(midpoint, self.min), self.max)
+        return self.max
+
+    def summary(self) -> dict:
+        """
+        Returns the count, mean, extremes and common quantiles of the samples.
+        """
+        if not self.count:
+            return {'count': 0}
+        return {
+            'count': self.count,
+            'mean': round(self.total / self.count, 3),
+            'min': self.min,
+            'p50': round(self.quantile(0.5), 3),
+            'p90': round(self.quantile(0.9), 3),
+            'p99': round(self.quantile(0.99), 3),
+            'max': self.max,
+        }
+
+
+class Telemetry:
+    def __init__(self, path: str = 'telemetry.jsonl', flush_interval: float = 10.0, max_pending: int = 65536):
+        """
+        Collects gameplay metrics off the game thread. The game only appends small tuples to a bounded queue; a
+        background thread folds them into fixed-size aggregates and appends a compact JSON snapshot to path every
+        flush_interval seconds. Each snapshot holds totals since start and a rolling window since the last snapshot.
+        If the queue is full the oldest pending events are dropped.
+
+        :param path: The file snapshots are appended to, one JSON object per line.
+        :param flush_interval: The number of seconds between snapshots.
+        :param max_pending: The maximum number of events waiting to be aggregated.
+        """
+        self.path = path
+        self.flush_interval = flush_interval
+        self._events = deque(maxlen=max_pending)
+        self._lock = threading.Lock()
+
+        self.sessions = 0
+        self.ticks = 0
+        self.deaths: Dict[str, int] = {}
+        self.difficulty_reached: Dict[int, int] = {}
+        self.final_scores = QuantileSketch()
+        self.tick_ms = QuantileSketch()
+
+        self._window_start = time.time()
+        self._window_ticks = 0
+        self._window_max_score = 0
+        self._window_max_difficulty = 0
+        self._window_tick_ms = QuantileSketch()
+
+        self._stop = threading.Event()
+        self._worker = threading.Thread(target=self._run, name='Telemetry', daemon=True)
+        self._worker.start()
+
+    def record_tick(self, score: int, difficulty: int, tick_ms: float):
+        """
+        Records one game tick. Cheap enough to call every tick.
+
+        :param score: The score after the tick.
+        :param difficulty: The difficulty level after the tick.
+        :param tick_ms: The duration of the tick in milliseconds.
+        """
+        self._events.append((_TICK, score, difficulty, tick_ms))
+
+    def end_session(self, score: int, difficulty: int, cause: str):
+        """
+        Records the end of a game.
+
+        :param score: The final score.
+        :param difficulty: The difficulty level reached.
+        :param cause: Why the game ended, e.g. 'wall', 'self', 'obstacle' or 'quit'.
+        """
+        self._events.append((_SESSION_END, score, difficulty, cause))
+
+    def snapshot(self) -> dict:
+        """
+        Aggregates pending events and returns the current totals and rolling window.
+        """
+        with self._lock:
+            return self._snapshot()
+
+    def flush(self):
+        """
+        Appends a snapshot to the telemetry file and starts a new rolling window.
+        """
+        with self._lock:
+            snapshot = self._snapshot()
+            self._window_start = time.time()
+            self._window_ticks = 0
+            self._window_max_score = 0
+            self._window_max_difficulty = 0
+            self._window_tick_ms.reset()
+        with open(self.path, 'a') as file:
+            file.write(json.dumps(snapshot, separators=(',', ':')) + '\n')
+
+    def close(self):
+        """
+        Stops the background thread and writes a final snapshot.
+        """
+        self._stop.set()
+        self._worker.join()
+        self.flush()
+
+    def _run(self):
+        """
+        Runs on the background thread, aggregating events a few times per second and flushing periodically.
+        """
+        next_flush = time.time() + self.flush_interval
+        while not self._stop.wait(0.1):
+            with self._lock:
+                self._drain()
+            if time.time() >= next_flush:
+                self.flush()
+                next_flush = time.time() + self.flush_interval
+
+    def _snapshot(self) -> dict:
+        """
+        Builds the snapshot returned by snapshot(). Must be called with the lock held.
+        """
+        self._drain()
+        now = time.time()
+        elapsed = now - self._window_start
+        return {
+            'time': round(now, 3),
+            'sessions': self.sessions,
+            'ticks': self.ticks,
+            'deaths': dict(self.deaths),
+            'difficulty_reached': {str(level): count for level, count in sorted(self.difficulty_reached.items())},
+            'final_score': self.final_scores.summary(),
+            'tick_ms': self.tick_ms.summary(),
+            'window': {
+                'seconds': round(elapsed, 3),
+                'ticks': self._window_ticks,
+                'tick_rate': round(self._window_ticks / elapsed, 3) if elapsed > 0 else 0.0,
+                'max_score': self._window_max_score,
+                'max_difficulty': self._window_max_difficulty,
+                'tick_ms': self._window_tick_ms.summary(),
+            },
+        }
+
+    def _drain(self):
+        """
+        Folds every pending event into the aggregates. Must be called with the lock held.
+        """
+        events = self._events
+        while events:
+            kind, score, difficulty, value = events.popleft()
+            if kind == _TICK:
+                self.ticks += 1
+                self.tick_ms.add(value)
+                self._window_ticks += 1
+                self._window_tick_ms.add(value)
+                if score > self._window_max_score:
+                    self._window_max_score = score
+                if difficulty > self._window_max_difficulty:
+                    self._window_max_difficulty = difficulty
+            else:
+                self.sessions += 1
+                self.deaths[value] = self.deaths.get(value, 0) + 1
+                self.difficulty_reached[difficulty] = self.difficulty_reached.get(difficulty, 0) + 1
+                self.final_scores.add(score)
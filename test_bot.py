@@ -0,0 +1,72 @@
+import unittest
+from bot import MCTSBot, SimState
+
+class TestSimState(unittest.TestCase):
+    
+    def setUp(self):
+        """
+        Set up a basic environment for each test.
+        """
+        self.state = SimState(cols=10, rows=10, body=[(5, 5), (4, 5), (3, 5)], direction=(1, 0), food=(8, 5), seed=7)
+
+    def test_step_moves_like_snake(self):
+        """
+        Test that a tick moves the head forward and drops the tail.
+        """
+        self.assertEqual(self.state.step((1, 0)), 0)
+        self.assertEqual(list(self.state.body), [(6, 5), (5, 5), (4, 5)])
+
+    def test_step_eats_and_respawns_food(self):
+        """
+        Test that eating grows the snake, scores and moves the food to a free cell.
+        """
+        self.state.step((1, 0))
+        self.state.step((1, 0))
+        self.assertEqual(self.state.step((1, 0)), 1)
+        self.assertEqual(self.state.score, 1)
+        self.assertEqual(len(self.state.body), 4)
+        self.assertNotIn(self.state.food, self.state.body)
+
+    def test_step_into_wall_kills(self):
+        """
+        Test that leaving the board ends the game.
+        """
+        self.state.step((0, -1))
+        for _ in range(5):
+            self.state.step((0, -1))
+        self.assertFalse(self.state.alive)
+
+    def test_step_wraps_around(self):
+        """
+        Test that a wrap-around board carries the snake across the edge.
+        """
+        state = SimState(cols=10, rows=10, body=[(9, 5), (8, 5), (7, 5)], direction=(1, 0), food=(0, 0), wrap=True)
+        state.step((1, 0))
+        self.assertTrue(state.alive)
+        self.assertEqual(state.body[0], (0, 5))
+
+    def test_clone_is_independent(self):
+        """
+        Test that moving a clone leaves the original untouched and vice versa.
+        """
+        clone = self.state.clone()
+        clone.step((0, 1))
+        self.assertEqual(list(self.state.body), [(5, 5), (4, 5), (3, 5)])
+        self.state.step((0, -1))
+        self.assertEqual(list(clone.body), [(5, 6), (5, 5), (4, 5)])
+        self.assertEqual(list(self.state.body), [(5, 4), (5, 5), (4, 5)])
+
+class TestMCTSBot(unittest.TestCase):
+
+    def test_plan_avoids_wall(self):
+        """
+        Test that the bot turns away from a wall directly ahead and reports its throughput.
+        """
+        state = SimState(cols=10, rows=10, body=[(9, 5), (8, 5), (7, 5)], direction=(1, 0), food=(0, 0), seed=3)
+        bot = MCTSBot(time_budget=1.0, max_rollouts=300)
+        self.assertIn(bot.plan(state), [(0, -1), (0, 1)])
+        self.assertEqual(bot.last_rollouts, 300)
+        self.assertGreater(bot.rollouts_per_second, 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import os
+import tempfile
+import unittest
+import pygame
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+if numpy is not None:
+    from capture import FrameRecorder
+
+@unittest.skipIf(numpy is None, "FrameRecorder requires numpy")
+class TestFrameRecorder(unittest.TestCase):
+    
+    def setUp(self):
+        """
+        Set up a basic environment for each test.
+        """
+        self.directory = tempfile.TemporaryDirectory()
+        self.surface = pygame.Surface((40, 30))
+        self.surface.fill((255, 0, 0))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_capture_writes_frames(self):
+        """
+        Test that captured frames are encoded to numbered images.
+        """
+        recorder = FrameRecorder(40, 30, output_dir=self.directory.name, capacity=4)
+        for _ in range(3):
+            recorder.capture(self.surface)
+        recorder.close()
+
+        frames = sorted(os.listdir(self.directory.name))
+        self.assertEqual(len(frames), recorder.frames_captured)
+        saved = pygame.image.load(os.path.join(self.directory.name, frames[0]))
+        self.assertEqual(saved.get_size(), (40, 30))
+        self.assertEqual(saved.get_at((0, 0))[:3], (255, 0, 0))
+
+    def test_capture_drops_frames_when_buffers_are_busy(self):
+        """
+        Test that capture drops frames instead of blocking when no buffer is free.
+        """
+        recorder = FrameRecorder(40, 30, output_dir=self.directory.name, capacity=1)
+        while recorder._free_slots.qsize():
+            recorder._free_slots.get()  # Pretend the encoder is still busy with every buffer
+
+        self.assertFalse(recorder.capture(self.surface))
+        self.assertEqual(recorder.frames_dropped, 1)
+        recorder.close()
+
+    @unittest.skipIf(Image is None, "GIF capture requires Pillow")
+    def test_capture_gif(self):
+        """
+        Test that GIF mode writes one animated GIF and drops frames past the frame limit.
+        """
+        recorder = FrameRecorder(40, 30, output_dir=self.directory.name, capacity=8, fmt='gif', max_gif_frames=3)
+        for color in [(255, 0, 0), (0, 255, 0), (0, 0, 255), (255, 255, 255)]:
+            self.surface.fill(color)
+            recorder.capture(self.surface)
+        recorder.close()
+
+        self.assertEqual(recorder.frames_captured, 3)
+        self.assertEqual(recorder.frames_dropped, 1)
+        self.assertEqual(os.listdir(self.directory.name), ['capture.gif'])
+        with Image.open(os.path.join(self.directory.name, 'capture.gif')) as gif:
+            self.assertEqual(gif.size, (40, 30))
+            self.assertEqual(gif.n_frames, 3)
+            self.assertEqual(gif.convert('RGB').getpixel((0, 0)), (255, 0, 0))
+
+if __name__ == '__main__':
+    unittest.main()
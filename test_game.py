@@ -1,6 +1,7 @@
 import unittest
 import pygame
 from game import Game
+from advanced import AdvancedGame
 from advanced import Obstacle
 from snake import Snake
 from food import Food
@@ -152,6 +153,91 @@ class TestGame(unittest.TestCase):
         self.assertEqual(self.game.score, 0, "Score did not reset after restart.")
         self.assertEqual(len(self.game.snake.body), 3, "Snake length did not reset after restart.")  # Assuming the initial length is 3
 
+    def test_reset_reuses_screen_and_clock(self):
+        """
+        Test that resetting the game restores the initial state without recreating the display or clock.
+        """
+        screen, clock = self.game.screen, self.game.clock
+        self.game.score = 7
+        self.game.game_over = True
+        self.game.snake.grow()
+
+        self.game.reset()
+
+        self.assertIs(self.game.screen, screen)
+        self.assertIs(self.game.clock, clock)
+        self.assertFalse(self.game.game_over)
+        self.assertEqual(self.game.score, 0)
+        self.assertEqual(len(self.game.snake.body), 3)
+
+    def test_pause_and_resume(self):
+        """
+        Test that P pauses the game and that pressing it again while paused resumes it.
+        """
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_p))
+        self.game.process_events()
+        self.assertTrue(self.game.paused)
+
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_p))
+        self.game.wait_while_paused()
+        self.assertFalse(self.game.paused)
+        self.assertFalse(self.game.game_over)
+
+    def test_focus_lost_pauses_until_focus_returns(self):
+        """
+        Test that the game pauses when its window loses focus and resumes by itself when focus returns.
+        """
+        pygame.event.post(pygame.event.Event(pygame.WINDOWFOCUSLOST))
+        self.game.process_events()
+        self.assertTrue(self.game.paused)
+
+        pygame.event.post(pygame.event.Event(pygame.WINDOWFOCUSGAINED))
+        self.game.wait_while_paused()
+        self.assertFalse(self.game.paused)
+        self.assertFalse(self.game.game_over)
+
+    def test_focus_gained_keeps_manual_pause(self):
+        """
+        Test that regaining focus does not resume a game the player paused with P.
+        """
+        pygame.event.clear()
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_p))
+        self.game.process_events()
+
+        pygame.event.post(pygame.event.Event(pygame.WINDOWFOCUSGAINED))
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_p))
+        self.game.wait_while_paused()
+        self.assertFalse(self.game.paused)
+        self.assertFalse(pygame.event.peek(pygame.KEYDOWN), "Game resumed before P was pressed.")
+
+    def test_obstacle_cells_follow_positions(self):
+        """
+        Test that the obstacle lookup set stays in sync when the positions are replaced.
+        """
+        self.game.obstacles.positions = [(120, 100), (140, 100)]
+        self.assertEqual(self.game.obstacles.cells, frozenset([(120, 100), (140, 100)]))
+
+        self.game.snake.body = [(100, 100), (80, 100), (60, 100)]
+        self.game.snake.direction = (1, 0)
+        self.game.update()
+        self.assertTrue(self.game.game_over)
+
+    def test_spawn_is_grid_aligned(self):
+        """
+        Test that the snake starts on the grid and survives its first move when the grid size does not divide half
+        the screen.
+        """
+        for game_class in (Game, AdvancedGame):
+            for grid_size in (30, 40):
+                game = game_class(screen_width=600, screen_height=400, grid_size=grid_size)
+                game.obstacles.positions = []
+                head_x, head_y = game.snake.body[0]
+                self.assertEqual((head_x % grid_size, head_y % grid_size), (0, 0))
+                self.assertIn(game.snake.body[0], game.snake.board.positions)
+
+                game.update()
+                self.assertFalse(game.game_over, f"{game_class.__name__} with grid size {grid_size} died on tick 1.")
+
     def test_obstacle_collision(self):
         """
         Test that the game ends when the snake collides with an obstacle.
@@ -0,0 +1,77 @@
+import os
+import random
+import tempfile
+import unittest
+from advanced import AdvancedGame
+from level import Level, generate_walls, generate_maze, load_or_generate, spawn_corridor
+
+class TestLevel(unittest.TestCase):
+    
+    def setUp(self):
+        """
+        Set up a basic environment for each test.
+        """
+        self.cols = 40
+        self.rows = 30
+        self.spawn = (20, 15)
+
+    def test_generate_walls_keeps_board_connected(self):
+        """
+        Test that scattered walls are distinct, leave the spawn corridor clear and keep every free cell reachable.
+        """
+        level = generate_walls(self.cols, self.rows, 600, self.spawn, random.Random(1))
+        self.assertGreaterEqual(len(level.walls), 600)
+        self.assertTrue(level.is_connected())
+        self.assertFalse(level.walls & spawn_corridor(self.cols, self.rows, self.spawn))
+
+    def test_generate_maze_keeps_board_connected(self):
+        """
+        Test that a generated maze has a clear spawn corridor and a single free region.
+        """
+        level = generate_maze(self.cols, self.rows, self.spawn, random.Random(2))
+        self.assertTrue(level.walls)
+        self.assertTrue(level.is_connected())
+        self.assertFalse(level.walls & spawn_corridor(self.cols, self.rows, self.spawn))
+
+    def test_save_and_load(self):
+        """
+        Test that a level survives a round trip through its serialized form.
+        """
+        level = generate_maze(self.cols, self.rows, self.spawn, random.Random(3))
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'maze.lvl')
+            level.save(path)
+            loaded = Level.load(path)
+        self.assertEqual((loaded.cols, loaded.rows), (self.cols, self.rows))
+        self.assertEqual(loaded.walls, level.walls)
+
+    def test_load_or_generate_uses_cache(self):
+        """
+        Test that a cached level is returned instead of being generated again.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            first = load_or_generate(directory, self.cols, self.rows, self.spawn, number_of_walls=50, seed=4)
+            second = load_or_generate(directory, self.cols, self.rows, self.spawn, number_of_walls=50, seed=4)
+            self.assertIs(first, second)
+            self.assertEqual(len(os.listdir(directory)), 1)
+
+    def test_first_food_avoids_walls(self):
+        """
+        Test that a game on a maze never starts with the food inside a wall, including after restarts.
+        """
+        level = generate_maze(30, 20, (15, 10), random.Random(5))
+        game = AdvancedGame(screen_width=600, screen_height=400, grid_size=20, level=level)
+        for _ in range(50):
+            self.assertNotIn(game.food.position, game.obstacles.cells)
+            self.assertNotIn(game.food.position, game.snake.body)
+            game.reset()
+
+    def test_positions(self):
+        """
+        Test that wall cells are converted to grid-aligned pixel positions.
+        """
+        level = Level(3, 2, [(2, 1), (0, 1), (1, 0)])
+        self.assertEqual(level.positions(20), [(20, 0), (0, 20), (40, 20)])
+
+if __name__ == '__main__':
+    unittest.main()
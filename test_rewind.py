@@ -0,0 +1,97 @@
+import unittest
+from advanced import AdvancedGame
+from rewind import RewindBuffer
+
+class TestRewindBuffer(unittest.TestCase):
+    
+    def setUp(self):
+        """
+        Set up a game with no obstacles and record a few laps of a square path, eating food on the way.
+        """
+        self.game = AdvancedGame(screen_width=200, screen_height=200, grid_size=20)
+        self.game.obstacles.positions = []
+        self.game.food.position = (140, 100)
+        self.buffer = RewindBuffer(capacity=64, keyframe_interval=8)
+        self.buffer.record(self.game)
+        self.snapshots = [self.snapshot()]
+
+        turns = {3: (0, 1), 6: (-1, 0), 9: (0, -1), 12: (1, 0)}
+        for tick in range(1, 41):
+            self.game.snake.change_direction(turns.get(tick % 12 or 12, self.game.snake.direction))
+            self.game.update()
+            self.buffer.record(self.game)
+            self.snapshots.append(self.snapshot())
+
+    def snapshot(self):
+        return (list(self.game.snake.body), self.game.food.position, self.game.score, self.game.snake.direction)
+
+    def test_recording_is_valid(self):
+        """
+        Test that the recorded game stayed alive, ate food and was recorded as deltas.
+        """
+        self.assertFalse(self.game.game_over)
+        self.assertGreater(self.game.score, 0)
+        self.assertEqual(self.buffer.current_tick, 40)
+
+    def test_rewind_and_step_forward(self):
+        """
+        Test that rewinding and stepping forward restore the recorded states exactly.
+        """
+        self.assertEqual(self.buffer.rewind(self.game, 5), 5)
+        self.assertEqual(self.snapshot(), self.snapshots[35])
+        self.assertEqual(self.buffer.rewind(self.game, 30), 30)
+        self.assertEqual(self.snapshot(), self.snapshots[5])
+        self.assertEqual(self.buffer.step_forward(self.game, 20), 20)
+        self.assertEqual(self.snapshot(), self.snapshots[25])
+
+    def test_seek_every_tick(self):
+        """
+        Test that every recorded tick can be reached, whether from a keyframe or from the current state.
+        """
+        for tick in (0, 17, 3, 40, 24, 1, 39):
+            self.buffer.seek(self.game, tick)
+            self.assertEqual(self.snapshot(), self.snapshots[tick])
+
+    def test_record_after_rewind_discards_redo(self):
+        """
+        Test that playing on after a rewind discards the rewound future.
+        """
+        self.buffer.rewind(self.game, 10)
+        self.game.update()
+        self.buffer.record(self.game)
+        self.assertEqual(self.buffer.newest_tick, 31)
+        self.assertEqual(self.buffer.step_forward(self.game, 5), 0)
+
+    def test_reset_starts_new_history(self):
+        """
+        Test that rewinding right after a restart stays on the new round's first tick instead of replaying the old one.
+        """
+        self.game.rewind_buffer = self.buffer
+        self.game.reset()
+        fresh = self.snapshot()
+        self.assertEqual(self.game.rewind(5), 0)
+        self.assertEqual(self.snapshot(), fresh)
+        self.assertEqual(self.game.score, 0)
+
+        self.game.update()
+        self.buffer.record(self.game)
+        self.assertEqual(self.game.rewind(5), 1)
+        self.assertEqual(self.snapshot(), fresh)
+
+    def test_capacity_is_bounded(self):
+        """
+        Test that only the last capacity ticks can be rewound.
+        """
+        buffer = RewindBuffer(capacity=16, keyframe_interval=4)
+        game = AdvancedGame(screen_width=200, screen_height=200, grid_size=20)
+        game.obstacles.positions = []
+        buffer.record(game)
+        for tick in range(1, 31):
+            game.snake.change_direction([(1, 0), (0, 1), (-1, 0), (0, -1)][(tick // 2) % 4])
+            game.update()
+            buffer.record(game)
+        self.assertEqual(buffer.rewind(game, 100), 16)
+        self.assertEqual(buffer.current_tick, 14)
+
+if __name__ == '__main__':
+    unittest.main()
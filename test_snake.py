@@ -1,5 +1,6 @@
 import unittest
 from snake import Snake
+from board import get_board
 
 class TestSnake(unittest.TestCase):
     
@@ -86,5 +87,32 @@ class TestSnake(unittest.TestCase):
         collision = self.snake.check_collision(screen_width=200, screen_height=200)
         self.assertFalse(collision)
 
+    def test_board_move_and_wall_collision(self):
+        """
+        Test that a snake on a walled board moves through the transition table and collides at the edge.
+        """
+        snake = Snake(initial_position=(160, 100), grid_size=20, board=get_board(10, 10, 20))
+        snake.move()
+        self.assertEqual(snake.body[0], (180, 100))
+        self.assertFalse(snake.check_collision(screen_width=200, screen_height=200))
+        snake.move()
+        self.assertTrue(snake.check_collision(screen_width=200, screen_height=200))
+
+    def test_wrap_around_board(self):
+        """
+        Test that a snake on a wrap-around board re-enters on the opposite edge without colliding.
+        """
+        snake = Snake(initial_position=(180, 100), grid_size=20, board=get_board(10, 10, 20, wrap=True))
+        snake.move()
+        self.assertEqual(snake.body[0], (0, 100))
+        self.assertFalse(snake.check_collision(screen_width=200, screen_height=200))
+
+    def test_boards_are_shared(self):
+        """
+        Test that boards with the same dimensions share one set of tables.
+        """
+        self.assertIs(get_board(10, 10, 20), get_board(10, 10, 20))
+        self.assertIsNot(get_board(10, 10, 20), get_board(10, 10, 20, wrap=True))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,140 @@
+import json
+import os
+import tempfile
+import time
+import unittest
+import pygame
+from advanced import AdvancedGame
+from rewind import RewindBuffer
+from telemetry import QuantileSketch, Telemetry
+
+class TestQuantileSketch(unittest.TestCase):
+
+    def test_quantiles_within_error(self):
+        """
+        Test that quantile estimates stay within the bucket error of the exact values.
+        """
+        sketch = QuantileSketch(growth=1.05)
+        for value in range(1, 10001):
+            sketch.add(value)
+        self.assertEqual(sketch.count, 10000)
+        self.assertAlmostEqual(sketch.quantile(0.5), 5000, delta=5000 * 0.05)
+        self.assertAlmostEqual(sketch.quantile(0.99), 9900, delta=9900 * 0.05)
+        self.assertLess(len(sketch.buckets), 200)
+
+    def test_empty_and_zero(self):
+        """
+        Test that an empty sketch has no quantiles and that zero samples are counted.
+        """
+        sketch = QuantileSketch()
+        self.assertIsNone(sketch.quantile(0.5))
+        sketch.add(0)
+        self.assertEqual(sketch.quantile(0.5), 0.0)
+
+class TestTelemetry(unittest.TestCase):
+    
+    def setUp(self):
+        """
+        Set up a telemetry pipeline writing to a temporary file.
+        """
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'telemetry.jsonl')
+        self.telemetry = Telemetry(path=self.path, flush_interval=60)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_snapshot_aggregates_events(self):
+        """
+        Test that ticks and finished sessions are folded into the snapshot.
+        """
+        for tick in range(100):
+            self.telemetry.record_tick(score=tick // 10, difficulty=1 + tick // 50, tick_ms=90 + tick % 20)
+        self.telemetry.end_session(score=9, difficulty=2, cause='wall')
+        self.telemetry.end_session(score=3, difficulty=1, cause='self')
+
+        snapshot = self.telemetry.snapshot()
+        self.assertEqual(snapshot['ticks'], 100)
+        self.assertEqual(snapshot['sessions'], 2)
+        self.assertEqual(snapshot['deaths'], {'wall': 1, 'self': 1})
+        self.assertEqual(snapshot['difficulty_reached'], {'1': 1, '2': 1})
+        self.assertEqual(snapshot['final_score']['max'], 9)
+        self.assertEqual(snapshot['window']['max_score'], 9)
+        self.assertEqual(snapshot['window']['max_difficulty'], 2)
+        self.assertEqual(snapshot['tick_ms']['min'], 90)
+        self.telemetry.close()
+
+    def test_close_flushes_snapshot(self):
+        """
+        Test that closing writes a snapshot line and that each flush starts a new window.
+        """
+        self.telemetry.record_tick(score=1, difficulty=1, tick_ms=100)
+        self.telemetry.flush()
+        self.telemetry.record_tick(score=2, difficulty=1, tick_ms=100)
+        self.telemetry.close()
+
+        with open(self.path) as file:
+            snapshots = [json.loads(line) for line in file]
+        self.assertEqual(len(snapshots), 2)
+        self.assertEqual([s['ticks'] for s in snapshots], [1, 2])
+        self.assertEqual([s['window']['ticks'] for s in snapshots], [1, 1])
+
+    def test_game_reports_each_round_once(self):
+        """
+        Test that a death that is rewound and replayed counts as a single finished round.
+        """
+        game = AdvancedGame(screen_width=200, screen_height=200, grid_size=20)
+        game.obstacles.positions = []
+        game.food.position = (0, 0)
+        game.telemetry = self.telemetry
+        game.rewind_buffer = RewindBuffer()
+        game.rewind_buffer.record(game)
+
+        for _ in range(2):
+            while not game.game_over:
+                game.update()
+                game.rewind_buffer.record(game)
+            self.assertEqual(game.death_cause, 'wall')
+            self.assertEqual(self.telemetry.snapshot()['sessions'], 0)
+            game.rewind(2)
+            self.assertFalse(game.game_over)
+        game.update()
+        game.update()
+        self.assertTrue(game.game_over)
+
+        game.reset()  # Restarting reports the round that died
+        self.assertEqual(self.telemetry.snapshot()['deaths'], {'wall': 1})
+        game.report_session()  # As on exit, for the fresh round
+
+        snapshot = self.telemetry.snapshot()
+        self.assertEqual(snapshot['sessions'], 2)
+        self.assertEqual(snapshot['deaths'], {'wall': 1, 'quit': 1})
+        self.telemetry.close()
+
+    def test_idle_waits_are_not_reported_as_ticks(self):
+        """
+        Test that time spent paused or on the game over screen does not show up in the tick durations.
+        """
+        game = AdvancedGame(screen_width=200, screen_height=200, grid_size=20)
+        game.telemetry = self.telemetry
+        game.clock.tick()
+
+        time.sleep(0.3)
+        game.paused = True
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_p))
+        game.wait_while_paused()
+        game.telemetry.record_tick(game.score, game.difficulty_level, game.clock.tick())
+
+        time.sleep(0.3)
+        game.game_over = True
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_r))
+        game.check_game_over()
+        game.telemetry.record_tick(game.score, game.difficulty_level, game.clock.tick())
+
+        snapshot = self.telemetry.snapshot()
+        self.assertEqual(snapshot['ticks'], 2)
+        self.assertLess(snapshot['tick_ms']['max'], 100)
+        self.telemetry.close()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,8 @@
 import pygame
 import random
-from typing import Tuple
+from typing import Optional, Tuple
+
+IDLE_TIMEOUT_MS = 500  # How long idle screens sleep in one wait before looping
 
 def random_position(grid_size: int, screen_width: int, screen_height: int) -> Tuple[int, int]:
     """
@@ -15,6 +17,18 @@ def random_position(grid_size: int, screen_width: int, screen_height: int) -> Tu
     y = random.randint(0, (screen_height // grid_size) - 1) * grid_size
     return (x, y)
 
+def spawn_position(screen_width: int, screen_height: int, grid_size: int) -> Tuple[int, int]:
+    """
+    Returns where the snake's head starts: the grid cell in the middle of the screen. Snapping to the grid keeps the
+    snake aligned with the food and the board even when the grid size does not divide half the screen.
+
+    :param screen_width: The width of the game screen.
+    :param screen_height: The height of the game screen.
+    :param grid_size: The size of the grid units.
+    :return: A tuple representing the (x, y) position.
+    """
+    return ((screen_width // grid_size) // 2 * grid_size, (screen_height // grid_size) // 2 * grid_size)
+
 def draw_text(screen, text: str, position: Tuple[int, int], font_size: int, color: Tuple[int, int, int] = (255, 255, 255)):
     """
     Renders text on the game screen.
@@ -29,13 +43,26 @@ def draw_text(screen, text: str, position: Tuple[int, int], font_size: int, colo
     text_surface = font.render(text, True, color)
     screen.blit(text_surface, position)
 
-def initialize_game(screen_width: int, screen_height: int, grid_size: int):
+def wait_for_event(timeout: int = IDLE_TIMEOUT_MS) -> Optional[pygame.event.Event]:
+    """
+    Blocks until the next event arrives or the timeout expires, so idle screens sleep instead of polling.
+
+    :param timeout: The maximum time to wait in milliseconds.
+    :return: The event, or None if the timeout expired first.
+    """
+    event = pygame.event.wait(timeout)
+    if event.type == pygame.NOEVENT:
+        return None
+    return event
+
+def initialize_game(screen_width: int, screen_height: int, grid_size: int, wrap: bool = False):
     """
     Initializes the game state, including setting up the Pygame display, creating the snake, and food.
 
     :param screen_width: The width of the game screen.
     :param screen_height: The height of the game screen.
     :param grid_size: The size of the grid units.
+    :param wrap: Whether the snake wraps around the screen edges instead of dying on them.
     :return: A tuple containing the initialized screen, clock, snake, and food objects.
     """
     pygame.init()
@@ -46,8 +73,11 @@ def initialize_game(screen_width: int, screen_height: int, grid_size: int):
 
     from snake import Snake
     from food import Food
+    from board import get_board
 
-    snake = Snake(initial_position=(screen_width // 2, screen_height // 2), grid_size=grid_size)
+    board = get_board(screen_width // grid_size, screen_height // grid_size, grid_size, wrap)
+    snake = Snake(initial_position=spawn_position(screen_width, screen_height, grid_size), grid_size=grid_size,
+                  board=board)
     food = Food(screen_width=screen_width, screen_height=screen_height, grid_size=grid_size)
 
     return screen, clock, snake, food
\ No newline at end of file